@@ -23,6 +23,8 @@ from rp2.rp2_error import RP2TypeError
 
 
 class AbstractEntry:
+    __slots__ = ("__configuration", "__asset")
+
     def __init__(
         self,
         configuration: Configuration,
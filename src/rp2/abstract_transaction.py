@@ -23,6 +23,8 @@ from rp2.rp2_error import RP2TypeError
 
 
 class AbstractTransaction(AbstractEntry):
+    __slots__ = ("__timestamp", "__transaction_type", "__spot_price", "__row", "__internal_id", "__unique_id", "__notes")
+
     def __init__(
         self,
         configuration: Configuration,
@@ -34,6 +34,8 @@ from rp2.transaction_set import TransactionSet
 
 @dataclass(frozen=True, eq=True)
 class YearlyGainLoss:
+    __slots__ = ("year", "asset", "transaction_type", "is_long_term_capital_gains", "crypto_amount", "fiat_amount", "fiat_cost_basis", "fiat_gain_loss")
+
     year: int
     asset: str
     transaction_type: TransactionType
@@ -362,7 +364,7 @@ class ComputedData:
     def get_in_lot_sold_percentage(self, in_transaction: InTransaction) -> RP2Decimal:
         """Percentage sold for a given InTransaction instance"""
         InTransaction.type_check("in_transaction", in_transaction)
-        return self.__in_lot_sold_percentage[in_transaction] if in_transaction in self.__in_lot_sold_percentage else ZERO
+        return self.__in_lot_sold_percentage.get(in_transaction, ZERO)
 
 
 def _yearly_gain_loss_sort_criteria(yearly_gain_loss: YearlyGainLoss) -> str:
@@ -24,6 +24,8 @@ from rp2.rp2_error import RP2RuntimeError, RP2TypeError, RP2ValueError
 
 
 class GainLoss(AbstractEntry):
+    __slots__ = ("__taxable_event", "__crypto_amount", "__acquired_lot", "__acquired_lot_fiat_fee_fraction")
+
     def __init__(
         self,
         configuration: Configuration,
@@ -67,6 +69,11 @@ class GainLoss(AbstractEntry):
         if acquired_lot is not None and taxable_event.asset != acquired_lot.asset:
             raise RP2ValueError(f"taxable_event.asset ({taxable_event.asset}) != acquired_lot.asset ({acquired_lot.asset})")
 
+        # Computed once here, rather than on every access, because report generators read it for every gain / loss row
+        self.__acquired_lot_fiat_fee_fraction: RP2Decimal = (
+            acquired_lot.fiat_fee * (self.__crypto_amount / acquired_lot.crypto_balance_change) if acquired_lot is not None else ZERO
+        )
+
     @classmethod
     def type_check(cls, name: str, instance: "AbstractEntry") -> "GainLoss":
         Configuration.type_check_parameter_name(name)
@@ -164,6 +171,10 @@ class GainLoss(AbstractEntry):
         # We don't simply multiply by acquired_lot_fraction_percentage to avoid potential precision loss with small percentages
         return (self.acquired_lot.fiat_in_with_fee * self.crypto_amount) / self.acquired_lot.crypto_balance_change
 
+    @property
+    def acquired_lot_fiat_fee_fraction(self) -> RP2Decimal:
+        return self.__acquired_lot_fiat_fee_fraction
+
     @property
     def taxable_event_fraction_percentage(self) -> RP2Decimal:
         return self.crypto_amount / self.taxable_event.crypto_balance_change
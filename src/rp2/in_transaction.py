@@ -24,6 +24,8 @@ from rp2.rp2_error import RP2TypeError, RP2ValueError
 
 
 class InTransaction(AbstractTransaction):
+    __slots__ = ("__exchange", "__holder", "__crypto_in", "__crypto_fee", "__fiat_fee", "__from_lot", "__to_lots", "__fiat_in_no_fee", "__fiat_in_with_fee")
+
     @classmethod
     def type_check(cls, name: str, instance: AbstractEntry) -> "InTransaction":
         Configuration.type_check_parameter_name(name)
@@ -22,6 +22,8 @@ from rp2.rp2_error import RP2TypeError, RP2ValueError
 
 
 class IntraTransaction(AbstractTransaction):
+    __slots__ = ("__from_exchange", "__from_holder", "__to_exchange", "__to_holder", "__crypto_sent", "__crypto_received", "__crypto_fee", "__fiat_fee")
+
     def __init__(
         self,
         configuration: Configuration,
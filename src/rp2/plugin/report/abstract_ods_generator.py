@@ -15,7 +15,7 @@
 import os
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import ezodf
 
@@ -30,6 +30,11 @@ from rp2.out_transaction import OutTransaction
 from rp2.rp2_decimal import RP2Decimal
 from rp2.rp2_error import RP2RuntimeError, RP2TypeError
 
+_PLUGIN_PATH: Path = Path(os.path.dirname(__file__)).absolute()
+
+# Template paths only depend on template name, country and language: resolve them (which requires filesystem checks) once per process
+_TEMPLATE_PATH_CACHE: Dict[Tuple[str, Optional[str], str], str] = {}
+
 
 class AbstractODSGenerator(AbstractReportGenerator):
     @classmethod
@@ -111,9 +116,18 @@ class AbstractODSGenerator(AbstractReportGenerator):
         return output_file
 
     def _get_template_path(self, template_name: str, country: Optional[AbstractCountry], generation_language: str) -> str:
+        key: Tuple[str, Optional[str], str] = (template_name, country.country_iso_code if country else None, generation_language)
+        template_path: Optional[str] = _TEMPLATE_PATH_CACHE.get(key)
+        if template_path is None:
+            template_path = self.__find_template_path(template_name, country, generation_language)
+            _TEMPLATE_PATH_CACHE[key] = template_path
+        return template_path
+
+    @staticmethod
+    def __find_template_path(template_name: str, country: Optional[AbstractCountry], generation_language: str) -> str:
         country_path = f"{country.country_iso_code}/" if country else ""
         language_suffix = f"_{generation_language}" if country else ""
-        base_path = Path(os.path.dirname(__file__)).absolute() / Path(f"data/{country_path}template_{template_name}{language_suffix}")
+        base_path = _PLUGIN_PATH / Path(f"data/{country_path}template_{template_name}{language_suffix}")
         ods_path = Path(f"{base_path}.ods")
         if ods_path.exists():
             return str(ods_path)
@@ -123,7 +137,7 @@ class AbstractODSGenerator(AbstractReportGenerator):
         # Look for a link (a .txt file containing the path to the .ods file)
         txt_path = Path(f"{base_path}.txt")
         if txt_path.exists():
-            new_ods_path = Path(os.path.dirname(__file__)).absolute()
+            new_ods_path = _PLUGIN_PATH
             with open(txt_path, encoding="utf-8") as template_link:
                 contents = template_link.read().strip()
                 if not contents or not contents.endswith(".ods"):
@@ -170,21 +184,71 @@ class AbstractODSGenerator(AbstractReportGenerator):
         Configuration.type_check_string("visual_style", visual_style)
         Configuration.type_check_string("data_style", data_style)
 
-        is_formula: bool = False
-        if isinstance(value, str) and value and value[0] == "=":
-            # If the value starts with '=' it is assumed to be a formula
-            is_formula = True
+        if apply_style:
+            Configuration.type_check_positive_int("row_index", row_index)
+            Configuration.type_check_positive_int("column_index", column_index)
+
+        # Look up the cell once and set value and style on it directly (rather than looking it up again in _apply_style_to_cell)
+        cell: Any = sheet[row_index, column_index]
+        cls._write_cell(cell, value)
+        if apply_style:
+            cell.style_name = f"{visual_style}_{data_style}"
 
-        style_name: str = f"{visual_style}_{data_style}"
+    @classmethod
+    def _fill_row(cls, sheet: Any, row_index: int, column_index: int, cells: Iterable[Tuple[Any, str, str]]) -> None:
+        # Fast path for tables: each cell is a (value, visual_style, data_style) tuple and is written to consecutive columns starting
+        # at column_index. Indexes are checked once per row rather than once per cell.
+        Configuration.type_check_positive_int("row_index", row_index)
+        Configuration.type_check_positive_int("column_index", column_index)
+
+        value: Any
+        visual_style: str
+        data_style: str
+        for value, visual_style, data_style in cells:
+            cell: Any = sheet[row_index, column_index]
+            cls._write_cell(cell, value)
+            cell.style_name = f"{visual_style}_{data_style}"
+            column_index += 1
+
+    @classmethod
+    def _fill_styled_row(cls, sheet: Any, row_index: int, column_index: int, values: Sequence[Any], style_names: Sequence[str]) -> None:
+        # Variant of _fill_row for tables whose rows all share the same styles: style_names holds the full style name of each column
+        # (e.g. "transparent_fiat"), so it can be built once per table and reused for every row.
+        Configuration.type_check_positive_int("row_index", row_index)
+        Configuration.type_check_positive_int("column_index", column_index)
+
+        value: Any
+        style_name: str
+        for value, style_name in zip(values, style_names):
+            cell: Any = sheet[row_index, column_index]
+            cls._write_cell(cell, value)
+            cell.style_name = style_name
+            column_index += 1
+
+    @staticmethod
+    def _fill_blank_cells(sheet: Any, row_index: int, column_index: int, count: int, visual_style: str = "transparent") -> None:
+        Configuration.type_check_positive_int("row_index", row_index)
+        Configuration.type_check_positive_int("column_index", column_index)
+        Configuration.type_check_positive_int("count", count)
+        Configuration.type_check_string("visual_style", visual_style)
+
+        style_name: str = f"{visual_style}_default"
+        index: int
+        for index in range(column_index, column_index + count):
+            cell: Any = sheet[row_index, index]
+            cell.set_value("")
+            cell.style_name = style_name
+
+    @staticmethod
+    def _write_cell(cell: Any, value: Any) -> None:
         if isinstance(value, RP2Decimal):
             # The ezodf API doesn't accept RP2Decimal, so we are forced to cast to float before writing to the spreadsheet
-            value = float(value)
-        if is_formula:
-            sheet[row_index, column_index].formula = value
+            cell.set_value(float(value))
+        elif isinstance(value, str) and value and value[0] == "=":
+            # If the value starts with '=' it is assumed to be a formula
+            cell.formula = value
         else:
-            sheet[row_index, column_index].set_value(value)
-        if apply_style:
-            cls._apply_style_to_cell(sheet=sheet, row_index=row_index, column_index=column_index, style_name=style_name)
+            cell.set_value(value)
 
     def _fill_header(
         self, title: str, header_row_1: List[str], header_row_2: List[str], sheet: Any, row_index: int, column_index: int, apply_style: bool = True
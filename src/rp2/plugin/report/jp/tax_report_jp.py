@@ -16,6 +16,7 @@ import logging
 from datetime import date
 from enum import Enum
 from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, NamedTuple, Optional, Set
 
@@ -182,7 +183,7 @@ class Generator(AbstractODSGenerator):
             previous_year_row_offset = self.__generate_asset_year(
                 asset=asset,
                 year=year,
-                transaction_list=sorted(transaction_set, key=lambda x: x.timestamp),
+                transaction_list=sorted(transaction_set, key=attrgetter("timestamp")),
                 output_file=output_file,
                 previous_year_row_offset=previous_year_row_offset,
             )
@@ -204,9 +205,9 @@ class Generator(AbstractODSGenerator):
 
         # Find the fee in yen
         fee_in_yen: RP2Decimal = ZERO
-        if RP2Decimal(transaction.crypto_fee) > ZERO:
+        if transaction.crypto_fee > ZERO:
             fee_in_yen = transaction.crypto_fee * transaction.spot_price
-        elif RP2Decimal(transaction.fiat_fee) > ZERO:
+        elif transaction.fiat_fee > ZERO:
             fee_in_yen = transaction.fiat_fee
 
         # Record the profit this year of crypto assets earned as income
@@ -255,17 +256,17 @@ class Generator(AbstractODSGenerator):
     def __process_out_transaction(self, transaction: OutTransaction) -> _TransactionRow:
         # Find the fee in yen
         fee_in_yen: RP2Decimal = ZERO
-        if RP2Decimal(transaction.crypto_fee) > ZERO:
+        if transaction.crypto_fee > ZERO:
             fee_in_yen = transaction.crypto_fee * transaction.spot_price
-        elif RP2Decimal(transaction.fiat_fee) > ZERO:
+        elif transaction.fiat_fee > ZERO:
             fee_in_yen = transaction.fiat_fee
 
         # DONATE can be used to reduce tax burden, GIFT is taxed as if sold at the moment it is gifted
         donated_amount_in_yen: Optional[RP2Decimal] = None
         sales_amount_in_yen: Optional[RP2Decimal] = None
         if transaction.transaction_type == TransactionType.DONATE:
-            donated_amount_in_yen = RP2Decimal(str(transaction.crypto_out_no_fee * transaction.spot_price))
-            sales_amount_in_yen = RP2Decimal("0")
+            donated_amount_in_yen = transaction.crypto_out_no_fee * transaction.spot_price
+            sales_amount_in_yen = ZERO
         else:
             sales_amount_in_yen = transaction.crypto_out_no_fee * transaction.spot_price
 
@@ -15,7 +15,7 @@
 import logging
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Set, cast
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 from rp2.abstract_country import AbstractCountry
 from rp2.computed_data import ComputedData
@@ -32,6 +32,12 @@ _TEMPLATE_SHEETS: Set[str] = {"Asset", "Asset - Exchange", "Input"}
 _TEMPLATE_SHEETS_TO_KEEP: Set[str] = {"__" + sheet_name for sheet_name in _TEMPLATE_SHEETS}
 _FIAT_UNIT_DATA_STYLE_2_DECIMAL_MINIMUM = RP2Decimal("1")
 _FIAT_UNIT_DATA_STYLE_4_DECIMAL_MINIMUM = RP2Decimal("0.20")
+# Unit cost basis upper bounds (exclusive) and their data style, in increasing order: values above the last bound use "fiat"
+_FIAT_UNIT_UPPER_BOUND_2_DATA_STYLE: Tuple[Tuple[RP2Decimal, str], ...] = (
+    (_FIAT_UNIT_DATA_STYLE_4_DECIMAL_MINIMUM, "fiat_unit_7"),
+    (_FIAT_UNIT_DATA_STYLE_2_DECIMAL_MINIMUM, "fiat_unit_4"),
+)
+_ONE: RP2Decimal = RP2Decimal("1")
 
 _ASSET: str = "Asset"
 _ASSET_EXCHANGE: str = "Asset - Exchange"
@@ -39,6 +45,25 @@ _INPUT: str = "Input"
 _INPUT_VALUE_STRING: str = "Enter asset value"
 _REPORT_INPUT_VALUE_STRING: str = "See Input tab"
 
+# Full style names of the columns of the totals rows, which are written with _fill_styled_row
+_ASSET_TOTALS_STYLE_NAMES: Tuple[str, ...] = tuple(
+    f"bold_border_{data_style}"
+    for data_style in ("default", "default", "default", "default", "fiat", "default", "default", "fiat", "fiat", "percent", "default", "default")
+)
+_ASSET_EXCHANGE_TOTALS_STYLE_NAMES: Tuple[str, ...] = tuple(
+    f"bold_border_{data_style}"
+    for data_style in ("default", "default", "default", "default", "default", "fiat", "default", "default", "fiat", "fiat", "percent", "default", "default")
+)
+
+
+def _get_fiat_unit_data_style(unit_cost_basis: RP2Decimal) -> str:
+    upper_bound: RP2Decimal
+    data_style: str
+    for upper_bound, data_style in _FIAT_UNIT_UPPER_BOUND_2_DATA_STYLE:
+        if unit_cost_basis < upper_bound:
+            return data_style
+    return "fiat"
+
 
 class Generator(AbstractODSGenerator):
     OUTPUT_FILE: str = "open_positions.ods"
@@ -218,7 +243,9 @@ class Generator(AbstractODSGenerator):
 
         self._fill_header(_("Asset Price Lookup Table"), self.__input_header_names_row_1, self.__input_header_names_row_2, input_sheet, 0, 0, apply_style=False)
 
-        row_indexes: Dict[str, int] = {sheet_name: self.HEADER_ROWS for sheet_name in _TEMPLATE_SHEETS}
+        input_row_index: int = self.HEADER_ROWS
+        asset_row_index: int = self.HEADER_ROWS
+        asset_exchange_row_index: int = self.HEADER_ROWS
 
         # First loop - primary data collection
         #  - total_cost_basis: total cost basis for all transactions and all assets
@@ -226,11 +253,15 @@ class Generator(AbstractODSGenerator):
         #  - holders: list of holders with non-zero balances.
         #  - asset_crypto_balance_holder: sum of crypto balance for each asset by holder
         #  - asset_crypto_balance_holder_exchange: sum of crypto balance for each asset by holder and exchange
+        #  - asset_total_crypto_balances: sum of crypto balance for each asset
         total_cost_basis = ZERO
         asset_cost_bases: Dict[str, RP2Decimal] = {}
         holders: List[str] = []
+        # Same content as holders, for constant-time membership checks (holders preserves the order in which they were found)
+        holder_set: Set[str] = set()
         asset_crypto_balance_holder: Dict[str, Dict[str, RP2Decimal]] = {}
         asset_crypto_balance_holder_exchange: Dict[str, Dict[str, Dict[str, RP2Decimal]]] = {}
+        asset_total_crypto_balances: Dict[str, RP2Decimal] = {}
 
         for asset, computed_data in asset_to_computed_data.items():
             if not isinstance(asset, str):
@@ -238,307 +269,254 @@ class Generator(AbstractODSGenerator):
             ComputedData.type_check("computed_data", computed_data)
 
             # process in-flow transactions to collect the fiat cost basis data.
-            for current_transaction in computed_data.in_transaction_set:
-                in_transaction = cast(InTransaction, current_transaction)
-                sold_percent: RP2Decimal = computed_data.get_in_lot_sold_percentage(in_transaction)
-                transaction_cost_basis: RP2Decimal = in_transaction.fiat_in_with_fee * (RP2Decimal("1") - sold_percent)
-
-                if transaction_cost_basis > ZERO:
-                    value = asset_cost_bases.setdefault(asset, ZERO)
-                    value += transaction_cost_basis
-                    asset_cost_bases[asset] = value
-
-                    total_cost_basis += transaction_cost_basis
+            get_in_lot_sold_percentage = computed_data.get_in_lot_sold_percentage
+            sold_percentages: Iterator[Tuple[InTransaction, RP2Decimal]] = (
+                (in_transaction, get_in_lot_sold_percentage(in_transaction)) for in_transaction in computed_data.in_transaction_set  # type: ignore
+            )
+            # Fully sold lots have no cost basis left: skip them without doing any Decimal arithmetic
+            transaction_cost_bases: Iterator[RP2Decimal] = (
+                in_transaction.fiat_in_with_fee * (_ONE - sold_percent) for in_transaction, sold_percent in sold_percentages if sold_percent < _ONE
+            )
+            asset_cost_basis: RP2Decimal = sum((cost_basis for cost_basis in transaction_cost_bases if cost_basis > ZERO), ZERO)
+            total_cost_basis += asset_cost_basis
+
+            if asset_cost_basis > ZERO:
+                asset_cost_bases[asset] = asset_cost_basis
 
             # process balance set data for the asset to collect holder and crypto balance data.
+            holder_2_crypto_balance: Dict[str, RP2Decimal] = {}
+            holder_2_exchange_2_crypto_balance: Dict[str, Dict[str, RP2Decimal]] = {}
+            total_crypto_balance: RP2Decimal = ZERO
             for balance_set in computed_data.balance_set:
-                if balance_set.final_balance > ZERO:
-                    if balance_set.holder not in holders:
-                        holders.append(balance_set.holder)
-
-                    if asset not in asset_crypto_balance_holder:
-                        asset_crypto_balance_holder[asset] = {}
-                        asset_crypto_balance_holder_exchange[asset] = {}
-
-                    if balance_set.holder not in asset_crypto_balance_holder[asset]:
-                        asset_crypto_balance_holder[asset][balance_set.holder] = ZERO
-                        asset_crypto_balance_holder_exchange[asset][balance_set.holder] = {}
+                final_balance: RP2Decimal = balance_set.final_balance
+                if final_balance > ZERO:
+                    holder: str = balance_set.holder
+                    if holder not in holder_set:
+                        holder_set.add(holder)
+                        holders.append(holder)
+
+                    holder_2_crypto_balance[holder] = holder_2_crypto_balance.get(holder, ZERO) + final_balance
+                    total_crypto_balance += final_balance
+                    holder_2_exchange_2_crypto_balance.setdefault(holder, {}).setdefault(balance_set.exchange, final_balance)
+
+            if holder_2_crypto_balance:
+                asset_crypto_balance_holder[asset] = holder_2_crypto_balance
+                asset_crypto_balance_holder_exchange[asset] = holder_2_exchange_2_crypto_balance
+                asset_total_crypto_balances[asset] = total_crypto_balance
+
+        # The number of rows of each sheet is known at this point: grow each sheet once, including the totals rows (one per holder
+        # if there are more than one, plus the grand total). Note that append_rows() rejects a count of zero.
+        last_asset_data_row: int = self.HEADER_ROWS + sum(len(asset_crypto_balance_holder[asset]) for asset in asset_cost_bases)
+        last_asset_exchange_data_row: int = self.HEADER_ROWS + sum(
+            len(exchanges) for asset in asset_cost_bases for exchanges in asset_crypto_balance_holder_exchange[asset].values()
+        )
+        totals_row_count: int = (len(holders) if len(holders) > 1 else 0) + 1
+        if asset_cost_bases:
+            input_sheet.append_rows(len(asset_cost_bases))
+        asset_sheet.append_rows(last_asset_data_row - self.HEADER_ROWS + totals_row_count)
+        asset_exchange_sheet.append_rows(last_asset_exchange_data_row - self.HEADER_ROWS + totals_row_count)
 
-                    asset_crypto_balance_holder[asset][balance_set.holder] += balance_set.final_balance
+        # There are several portfolio-wide fields in the output that are dependent on values the user enters into the Input tab for
+        # live calculation that cannot be accounted for in this report. Since I want to include a totals row in the output, I cannot do
+        # full-column sums, e.g. =G4/SUM(G:G), so instead I am using the row index and the header rows info to scope the SUM to the
+        # actual rows I know I have placed data into.
 
-                    if balance_set.exchange not in asset_crypto_balance_holder_exchange[asset][balance_set.holder]:
-                        asset_crypto_balance_holder_exchange[asset][balance_set.holder][balance_set.exchange] = balance_set.final_balance
+        # The ranges are the same for every row and for the totals rows: build them once per sheet
+        first_data_row: int = self.HEADER_ROWS + 1
+        asset_holder_range: str = f"B${first_data_row}:B${last_asset_data_row}"
+        asset_cost_basis_range: str = f"E${first_data_row}:E${last_asset_data_row}"
+        asset_value_range: str = f"H${first_data_row}:H${last_asset_data_row}"
+        asset_gain_loss_range: str = f"I${first_data_row}:I${last_asset_data_row}"
+        asset_cost_basis_sum: str = f"SUM({asset_cost_basis_range})"
+        asset_value_sum: str = f"SUM({asset_value_range})"
+
+        asset_exchange_holder_range: str = f"B${first_data_row}:B${last_asset_exchange_data_row}"
+        asset_exchange_cost_basis_range: str = f"F${first_data_row}:F${last_asset_exchange_data_row}"
+        asset_exchange_value_range: str = f"I${first_data_row}:I${last_asset_exchange_data_row}"
+        asset_exchange_gain_loss_range: str = f"J${first_data_row}:J${last_asset_exchange_data_row}"
+        asset_exchange_cost_basis_sum: str = f"SUM({asset_exchange_cost_basis_range})"
+        asset_exchange_value_sum: str = f"SUM({asset_exchange_value_range})"
+
+        # Bind the row writer and the translated Input sheet name (used in every lookup formula) to locals
+        fill_row = self._fill_row
+        input_sheet_name: str = _("Input")
 
         # Now looping through the assets to do the reporting.
         for asset, asset_cost_basis in asset_cost_bases.items():
-            total_crypto_balance = ZERO
-            for crypto_balance in asset_crypto_balance_holder[asset].values():
-                total_crypto_balance += crypto_balance
-
-            unit_cost_basis: RP2Decimal = asset_cost_basis / total_crypto_balance
+            unit_cost_basis: RP2Decimal = asset_cost_basis / asset_total_crypto_balances[asset]
 
             # For report clarity, change how much precision is displayed in the output based on the unit price. The raw value is
             # included in the output, so if the user desires they can change the cell format in the resulting file.
             # The default windowing is set up to hopefully give a good user experience for high value cryptos like BTC
             # all the way through cryptos with minute unit values like SHIB.
-            unit_data_style: str = "fiat"
-            if _FIAT_UNIT_DATA_STYLE_4_DECIMAL_MINIMUM <= unit_cost_basis < _FIAT_UNIT_DATA_STYLE_2_DECIMAL_MINIMUM:
-                unit_data_style = "fiat_unit_4"
-            elif unit_cost_basis < _FIAT_UNIT_DATA_STYLE_4_DECIMAL_MINIMUM:
-                unit_data_style = "fiat_unit_7"
+            unit_data_style: str = _get_fiat_unit_data_style(unit_cost_basis)
 
             # Add this asset to the Input sheet where the user will enter pricing value for the calculations
-            input_sheet.append_rows(1)
-            input_row_index: int = row_indexes[_INPUT]
-            self._fill_cell(input_sheet, input_row_index, 0, asset)
-            self._fill_cell(input_sheet, input_row_index, 1, _INPUT_VALUE_STRING, data_style="fiat_unit_7")
-            row_indexes[_INPUT] = input_row_index + 1
+            fill_row(input_sheet, input_row_index, 0, ((asset, "transparent", "default"), (_INPUT_VALUE_STRING, "transparent", "fiat_unit_7")))
+            input_row_index += 1
 
             _vlookup_formula: str = ""
             _lookup_field: str = ""
 
-            # Complete the asset table.
+            # Complete the asset table and, for each holder, the Asset/Exchange table which will calc vals that will feed the asset table.
+            holder_2_exchange_2_crypto_balance = asset_crypto_balance_holder_exchange[asset]
             for holder, holder_crypto_balance in asset_crypto_balance_holder[asset].items():
                 holder_cost_basis: RP2Decimal = holder_crypto_balance * unit_cost_basis
+                # 1-based row number used in all the formulas of the row
+                row_number: int = asset_row_index + 1
 
-                asset_sheet.append_rows(1)
-                asset_row_index: int = row_indexes[_ASSET]
-                _vlookup_formula = f"VLOOKUP(A{asset_row_index+1};${_('Input')}.A:B;2;0)"
+                _vlookup_formula = f"VLOOKUP(A{row_number};${input_sheet_name}.A:B;2;0)"
                 _lookup_field = f'=IF({_vlookup_formula}="{_INPUT_VALUE_STRING}";"{_REPORT_INPUT_VALUE_STRING}";{_vlookup_formula}'
 
-                self._fill_cell(asset_sheet, asset_row_index, 0, asset)
-                self._fill_cell(asset_sheet, asset_row_index, 1, holder)
-                self._fill_cell(asset_sheet, asset_row_index, 2, holder_crypto_balance, data_style="crypto")
-                self._fill_cell(asset_sheet, asset_row_index, 3, unit_cost_basis, data_style=unit_data_style)
-                self._fill_cell(asset_sheet, asset_row_index, 4, holder_cost_basis, data_style="fiat")
-                self._fill_cell(asset_sheet, asset_row_index, 5, holder_cost_basis / total_cost_basis, data_style="percent")
-                self._fill_cell(asset_sheet, asset_row_index, 6, _lookup_field, data_style=unit_data_style)
-                self._fill_cell(asset_sheet, asset_row_index, 7, f"=C{asset_row_index+1}*G{asset_row_index+1}", data_style="fiat")
-                self._fill_cell(asset_sheet, asset_row_index, 8, f"=H{asset_row_index+1}-E{asset_row_index+1}", data_style="fiat")
-                self._fill_cell(asset_sheet, asset_row_index, 9, f"=(H{asset_row_index+1}-E{asset_row_index+1})/E{asset_row_index+1}", data_style="percent")
-                row_indexes[_ASSET] = asset_row_index + 1
-
-            # Generate the Asset/Exchange table which will calc vals that will feed the asset table.
-            for holder, exchanges in asset_crypto_balance_holder_exchange[asset].items():
-                for exchange, crypto_exchange_balance in exchanges.items():
+                fill_row(
+                    asset_sheet,
+                    asset_row_index,
+                    0,
+                    (
+                        (asset, "transparent", "default"),
+                        (holder, "transparent", "default"),
+                        (holder_crypto_balance, "transparent", "crypto"),
+                        (unit_cost_basis, "transparent", unit_data_style),
+                        (holder_cost_basis, "transparent", "fiat"),
+                        (holder_cost_basis / total_cost_basis, "transparent", "percent"),
+                        (_lookup_field, "transparent", unit_data_style),
+                        (f"=C{row_number}*G{row_number}", "transparent", "fiat"),
+                        (f"=H{row_number}-E{row_number}", "transparent", "fiat"),
+                        (f"=(H{row_number}-E{row_number})/E{row_number}", "transparent", "percent"),
+                        (f"=I{row_number}/{asset_cost_basis_sum}", "transparent", "percent"),
+                        (f"=H{row_number}/{asset_value_sum}", "transparent", "percent"),
+                    ),
+                )
+                asset_row_index += 1
+
+                for exchange, crypto_exchange_balance in holder_2_exchange_2_crypto_balance[holder].items():
                     exchange_cost_basis: RP2Decimal = crypto_exchange_balance * unit_cost_basis
+                    row_number = asset_exchange_row_index + 1
 
-                    asset_exchange_sheet.append_rows(1)
-                    asset_exchange_row_index: int = row_indexes[_ASSET_EXCHANGE]
-                    _vlookup_formula = f"VLOOKUP(A{asset_exchange_row_index+1};${_('Input')}.A:B;2;0)"
+                    _vlookup_formula = f"VLOOKUP(A{row_number};${input_sheet_name}.A:B;2;0)"
                     _lookup_field = f'=IF({_vlookup_formula}="{_INPUT_VALUE_STRING}";"{_REPORT_INPUT_VALUE_STRING}";{_vlookup_formula}'
 
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 0, asset)
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 1, holder)
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 2, exchange)
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 3, crypto_exchange_balance, data_style="crypto")
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 4, unit_cost_basis, data_style=unit_data_style)
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 5, exchange_cost_basis, data_style="fiat")
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 6, exchange_cost_basis / total_cost_basis, data_style="percent")
-                    self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 7, _lookup_field, data_style=unit_data_style)
-                    self._fill_cell(
-                        asset_exchange_sheet, asset_exchange_row_index, 8, f"=D{asset_exchange_row_index+1}*H{asset_exchange_row_index+1}", data_style="fiat"
-                    )
-                    self._fill_cell(
-                        asset_exchange_sheet, asset_exchange_row_index, 9, f"=I{asset_exchange_row_index+1}-F{asset_exchange_row_index+1}", data_style="fiat"
-                    )
-                    self._fill_cell(
+                    fill_row(
                         asset_exchange_sheet,
                         asset_exchange_row_index,
-                        10,
-                        f"=(I{asset_exchange_row_index+1}-F{asset_exchange_row_index+1})/F{asset_exchange_row_index+1}",
-                        data_style="percent",
+                        0,
+                        (
+                            (asset, "transparent", "default"),
+                            (holder, "transparent", "default"),
+                            (exchange, "transparent", "default"),
+                            (crypto_exchange_balance, "transparent", "crypto"),
+                            (unit_cost_basis, "transparent", unit_data_style),
+                            (exchange_cost_basis, "transparent", "fiat"),
+                            (exchange_cost_basis / total_cost_basis, "transparent", "percent"),
+                            (_lookup_field, "transparent", unit_data_style),
+                            (f"=D{row_number}*H{row_number}", "transparent", "fiat"),
+                            (f"=I{row_number}-F{row_number}", "transparent", "fiat"),
+                            (f"=(I{row_number}-F{row_number})/F{row_number}", "transparent", "percent"),
+                            (f"=J{row_number}/{asset_exchange_cost_basis_sum}", "transparent", "percent"),
+                            (f"=I{row_number}/{asset_exchange_value_sum}", "transparent", "percent"),
+                        ),
                     )
-                    row_indexes[_ASSET_EXCHANGE] = asset_exchange_row_index + 1
-
-        # There are several portfolio-wide fields in the output that are dependent on values the user enters into the Input tab for
-        # live calculation that cannot be accounted for in this report. Since I want to include a totals row in the output, I cannot do
-        # full-column sums, e.g. =G4/SUM(G:G), so instead I am using the row index and the header rows info to scope the SUM to the
-        # actual rows I know I have placed data into.
-
-        asset_row_index = row_indexes[_ASSET]
-        for row_idx in range(self.HEADER_ROWS, row_indexes[_ASSET]):
-            self._fill_cell(asset_sheet, row_idx, 10, f"=I{row_idx+1}/SUM(E${self.HEADER_ROWS+1}:E${asset_row_index})", data_style="percent")
-            self._fill_cell(asset_sheet, row_idx, 11, f"=H{row_idx+1}/SUM(H${self.HEADER_ROWS+1}:H${asset_row_index})", data_style="percent")
-
-        asset_exchange_row_index = row_indexes[_ASSET_EXCHANGE]
-        for row_idx in range(self.HEADER_ROWS, row_indexes[_ASSET_EXCHANGE]):
-            self._fill_cell(asset_exchange_sheet, row_idx, 11, f"=J{row_idx+1}/SUM(F${self.HEADER_ROWS+1}:F${asset_exchange_row_index})", data_style="percent")
-            self._fill_cell(asset_exchange_sheet, row_idx, 12, f"=I{row_idx+1}/SUM(I${self.HEADER_ROWS+1}:I${asset_exchange_row_index})", data_style="percent")
-
-        # Save the last row index containing data so multiple total rows can be added.
-        last_data_row_indexes = row_indexes.copy()
+                    asset_exchange_row_index += 1
 
         # Asset sheet totals.
         if len(holders) > 1:
             for holder in holders:
-                asset_sheet.append_rows(1)
-                asset_row_index = row_indexes[_ASSET]
-                last_data_index = last_data_row_indexes[_ASSET]
-                self._fill_cell(asset_sheet, asset_row_index, 0, _("Total"), visual_style="bold_border")
-                self._fill_cell(asset_sheet, asset_row_index, 1, holder, visual_style="bold_border")
-                self._fill_cell(asset_sheet, asset_row_index, 2, "", visual_style="bold_border")
-                self._fill_cell(asset_sheet, asset_row_index, 3, "", visual_style="bold_border")
-                self._fill_cell(
-                    asset_sheet,
-                    asset_row_index,
-                    4,
-                    f'=SUMIF(B${self.HEADER_ROWS+1}:B${last_data_index};"{holder}";E${self.HEADER_ROWS+1}:E${last_data_index})',
-                    visual_style="bold_border",
-                    data_style="fiat",
-                )
-                self._fill_cell(asset_sheet, asset_row_index, 5, "", visual_style="bold_border")
-                self._fill_cell(asset_sheet, asset_row_index, 6, "", visual_style="bold_border")
-                self._fill_cell(
-                    asset_sheet,
-                    asset_row_index,
-                    7,
-                    f'=SUMIF(B${self.HEADER_ROWS+1}:B${last_data_index};"{holder}";H${self.HEADER_ROWS+1}:H${last_data_index})',
-                    visual_style="bold_border",
-                    data_style="fiat",
-                )
-                self._fill_cell(
+                self._fill_styled_row(
                     asset_sheet,
                     asset_row_index,
-                    8,
-                    f'=SUMIF(B${self.HEADER_ROWS+1}:B${last_data_index};"{holder}";I${self.HEADER_ROWS+1}:I${last_data_index})',
-                    visual_style="bold_border",
-                    data_style="fiat",
+                    0,
+                    (
+                        _("Total"),
+                        holder,
+                        "",
+                        "",
+                        f'=SUMIF({asset_holder_range};"{holder}";{asset_cost_basis_range})',
+                        "",
+                        "",
+                        f'=SUMIF({asset_holder_range};"{holder}";{asset_value_range})',
+                        f'=SUMIF({asset_holder_range};"{holder}";{asset_gain_loss_range})',
+                        f"=(H{asset_row_index+1}-E{asset_row_index+1})/E{asset_row_index+1}",
+                        "",
+                        "",
+                    ),
+                    _ASSET_TOTALS_STYLE_NAMES,
                 )
-                self._fill_cell(
-                    asset_sheet,
-                    asset_row_index,
-                    9,
-                    f"=(H{asset_row_index+1}-E{asset_row_index+1})/E{asset_row_index+1}",
-                    visual_style="bold_border",
-                    data_style="percent",
-                )
-                self._fill_cell(asset_sheet, asset_row_index, 10, "", visual_style="bold_border")
-                self._fill_cell(asset_sheet, asset_row_index, 11, "", visual_style="bold_border")
-                row_indexes[_ASSET] = asset_row_index + 1
-
-        asset_sheet.append_rows(1)
-        asset_row_index = row_indexes[_ASSET]
-        last_data_index = last_data_row_indexes[_ASSET]
-        self._fill_cell(asset_sheet, asset_row_index, 0, _("Grand Total"), visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 1, "", visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 2, "", visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 3, "", visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 4, f"=SUM(E${self.HEADER_ROWS+1}:E${last_data_index})", visual_style="bold_border", data_style="fiat")
-        self._fill_cell(asset_sheet, asset_row_index, 5, "", visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 6, "", visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 7, f"=SUM(H${self.HEADER_ROWS+1}:H${last_data_index})", visual_style="bold_border", data_style="fiat")
-        self._fill_cell(asset_sheet, asset_row_index, 8, f"=SUM(I${self.HEADER_ROWS+1}:I${last_data_index})", visual_style="bold_border", data_style="fiat")
-        self._fill_cell(
+                asset_row_index += 1
+
+        self._fill_styled_row(
             asset_sheet,
             asset_row_index,
-            9,
-            f"=(H{asset_row_index+1}-E{asset_row_index+1})/E{asset_row_index+1}",
-            visual_style="bold_border",
-            data_style="percent",
+            0,
+            (
+                _("Grand Total"),
+                "",
+                "",
+                "",
+                f"={asset_cost_basis_sum}",
+                "",
+                "",
+                f"={asset_value_sum}",
+                f"=SUM({asset_gain_loss_range})",
+                f"=(H{asset_row_index+1}-E{asset_row_index+1})/E{asset_row_index+1}",
+                "",
+                "",
+            ),
+            _ASSET_TOTALS_STYLE_NAMES,
         )
-        self._fill_cell(asset_sheet, asset_row_index, 10, "", visual_style="bold_border")
-        self._fill_cell(asset_sheet, asset_row_index, 11, "", visual_style="bold_border")
-        row_indexes[_ASSET] = asset_row_index + 1
+        asset_row_index += 1
 
         # Asset - Exchange sheet totals.
         if len(holders) > 1:
             for holder in holders:
-                asset_exchange_sheet.append_rows(1)
-                asset_exchange_row_index = row_indexes[_ASSET_EXCHANGE]
-                last_data_index = last_data_row_indexes[_ASSET_EXCHANGE]
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 0, _("Total"), visual_style="bold_border")
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 1, holder, visual_style="bold_border")
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 2, "", visual_style="bold_border")
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 3, "", visual_style="bold_border")
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 4, "", visual_style="bold_border")
-                self._fill_cell(
-                    asset_exchange_sheet,
-                    asset_exchange_row_index,
-                    5,
-                    f'=SUMIF(B${self.HEADER_ROWS+1}:B${last_data_index};"{holder}";F${self.HEADER_ROWS+1}:F${last_data_index})',
-                    visual_style="bold_border",
-                    data_style="fiat",
-                )
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 6, "", visual_style="bold_border")
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 7, "", visual_style="bold_border")
-                self._fill_cell(
-                    asset_exchange_sheet,
-                    asset_exchange_row_index,
-                    8,
-                    f'=SUMIF(B${self.HEADER_ROWS+1}:B${last_data_index};"{holder}";I${self.HEADER_ROWS+1}:I${last_data_index})',
-                    visual_style="bold_border",
-                    data_style="fiat",
-                )
-                self._fill_cell(
+                self._fill_styled_row(
                     asset_exchange_sheet,
                     asset_exchange_row_index,
-                    9,
-                    f'=SUMIF(B${self.HEADER_ROWS+1}:B${last_data_index};"{holder}";J${self.HEADER_ROWS+1}:J${last_data_index})',
-                    visual_style="bold_border",
-                    data_style="fiat",
-                )
-                self._fill_cell(
-                    asset_exchange_sheet,
-                    asset_exchange_row_index,
-                    10,
-                    f"=(I{asset_exchange_row_index+1}-F{asset_exchange_row_index+1})/F{asset_exchange_row_index+1}",
-                    visual_style="bold_border",
-                    data_style="percent",
+                    0,
+                    (
+                        _("Total"),
+                        holder,
+                        "",
+                        "",
+                        "",
+                        f'=SUMIF({asset_exchange_holder_range};"{holder}";{asset_exchange_cost_basis_range})',
+                        "",
+                        "",
+                        f'=SUMIF({asset_exchange_holder_range};"{holder}";{asset_exchange_value_range})',
+                        f'=SUMIF({asset_exchange_holder_range};"{holder}";{asset_exchange_gain_loss_range})',
+                        f"=(I{asset_exchange_row_index+1}-F{asset_exchange_row_index+1})/F{asset_exchange_row_index+1}",
+                        "",
+                        "",
+                    ),
+                    _ASSET_EXCHANGE_TOTALS_STYLE_NAMES,
                 )
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 11, "", visual_style="bold_border")
-                self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 12, "", visual_style="bold_border")
-                row_indexes[_ASSET_EXCHANGE] = asset_exchange_row_index + 1
-
-        asset_exchange_sheet.append_rows(1)
-        asset_exchange_row_index = row_indexes[_ASSET_EXCHANGE]
-        last_data_index = last_data_row_indexes[_ASSET_EXCHANGE]
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 0, _("Grand Total"), visual_style="bold_border")
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 1, "", visual_style="bold_border")
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 2, "", visual_style="bold_border")
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 3, "", visual_style="bold_border")
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 4, "", visual_style="bold_border")
-        self._fill_cell(
-            asset_exchange_sheet,
-            asset_exchange_row_index,
-            5,
-            f"=SUM(F${self.HEADER_ROWS+1}:F${last_data_index})",
-            visual_style="bold_border",
-            data_style="fiat",
-        )
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 6, "", visual_style="bold_border")
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 7, "", visual_style="bold_border")
-        self._fill_cell(
-            asset_exchange_sheet,
-            asset_exchange_row_index,
-            8,
-            f"=SUM(I${self.HEADER_ROWS+1}:I${last_data_index})",
-            visual_style="bold_border",
-            data_style="fiat",
-        )
-        self._fill_cell(
-            asset_exchange_sheet,
-            asset_exchange_row_index,
-            9,
-            f"=SUM(J${self.HEADER_ROWS+1}:J${last_data_index})",
-            visual_style="bold_border",
-            data_style="fiat",
-        )
-        self._fill_cell(
+                asset_exchange_row_index += 1
+
+        self._fill_styled_row(
             asset_exchange_sheet,
             asset_exchange_row_index,
-            10,
-            f"=(I{asset_exchange_row_index+1}-F{asset_exchange_row_index+1})/F{asset_exchange_row_index+1}",
-            visual_style="bold_border",
-            data_style="percent",
+            0,
+            (
+                _("Grand Total"),
+                "",
+                "",
+                "",
+                "",
+                f"={asset_exchange_cost_basis_sum}",
+                "",
+                "",
+                f"={asset_exchange_value_sum}",
+                f"=SUM({asset_exchange_gain_loss_range})",
+                f"=(I{asset_exchange_row_index+1}-F{asset_exchange_row_index+1})/F{asset_exchange_row_index+1}",
+                "",
+                "",
+            ),
+            _ASSET_EXCHANGE_TOTALS_STYLE_NAMES,
         )
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 11, "", visual_style="bold_border")
-        self._fill_cell(asset_exchange_sheet, asset_exchange_row_index, 12, "", visual_style="bold_border")
-        row_indexes[_ASSET_EXCHANGE] = asset_exchange_row_index + 1
+        asset_exchange_row_index += 1
 
         asset_sheet.name = _("Asset")
         asset_exchange_sheet.name = _("Asset - Exchange")
-        input_sheet.name = _("Input")
+        input_sheet.name = input_sheet_name
 
         output_file.save()
         LOGGER.info("Plugin '%s' output: %s", __name__, Path(output_file.docname).resolve())
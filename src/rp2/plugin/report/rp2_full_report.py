@@ -16,16 +16,17 @@
 
 import logging
 from datetime import date
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional, Set, cast
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import ezodf
 
 from rp2.abstract_country import AbstractCountry
-from rp2.abstract_entry import AbstractEntry
 from rp2.abstract_transaction import AbstractTransaction
 from rp2.balance import BalanceSet
 from rp2.computed_data import ComputedData, YearlyGainLoss
+from rp2.entry_types import TransactionType
 from rp2.gain_loss import GainLoss
 from rp2.gain_loss_set import GainLossSet
 from rp2.in_transaction import InTransaction
@@ -52,24 +53,44 @@ class _BorderStyle(NamedTuple):
     border_suffix: str
 
 
-class _AssetAndYear(NamedTuple):
-    asset: str
-    year: int
+_ZERO: RP2Decimal = RP2Decimal(0)
 
+# Full style names for each border suffix, so table loops don't concatenate them per cell
+_BORDER_SUFFIX_2_STYLE_NAMES: Dict[str, Dict[str, str]] = {
+    border_suffix: {
+        style: f"{style}{border_suffix}"
+        for style in (
+            "acquired_lot",
+            "acquired_lot_alt",
+            "acquired_lot_note",
+            "bold",
+            "highlighted",
+            "taxable_event",
+            "taxable_event_alt",
+            "taxable_event_note",
+            "transparent",
+        )
+    }
+    for border_suffix in ("", "_border")
+}
 
-_ZERO: RP2Decimal = RP2Decimal(0)
+# (is_taxable, has_border) -> (visual_style, highlighted_style)
+_TAXABLE_AND_BORDER_2_TRANSACTION_STYLES: Dict[Tuple[bool, bool], Tuple[str, str]] = {
+    (False, False): ("transparent", "transparent"),
+    (True, False): ("taxable_event", "highlighted"),
+    (False, True): ("transparent_border", "transparent_border"),
+    (True, True): ("taxable_event_border", "highlighted_border"),
+}
 
 
 class Generator(AbstractODSGenerator):
     MIN_ROWS: int = 40
-    MAX_COLUMNS: int = 40
+    TRANSACTION_SHEET_COLUMNS: int = 16
+    OUTPUT_SHEET_COLUMNS: int = 20
     OUTPUT_FILE: str = "rp2_full_report.ods"
 
     TEMPLATE_SHEETS_TO_KEEP: Set[str] = {"__Summary"}
 
-    __in_out_sheet_transaction_2_row: Dict[AbstractTransaction, int] = {}
-    __tax_sheet_year_2_row: Dict[_AssetAndYear, int] = {}
-
     __legend: List[List[str]] = []
     __yearly_gain_loss_summary_header_names_row_1: List[str] = []
     __yearly_gain_loss_summary_header_names_row_2: List[str] = []
@@ -85,6 +106,16 @@ class Generator(AbstractODSGenerator):
     __gain_loss_summary_header_names_row_2: List[str] = []
     __gain_loss_detail_header_names_row_1: List[str] = []
     __gain_loss_detail_header_names_row_2: List[str] = []
+    __transaction_type_2_label: Dict[TransactionType, str] = {}
+    __taxable_labels: Tuple[str, str] = ("", "")
+    __capital_gains_types: Tuple[str, str] = ("", "")
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Keyed by id(transaction): transactions are owned by ComputedData and outlive the generation
+        self.__in_out_sheet_transaction_2_row: Dict[int, int] = {}
+        # Keyed by (asset, year)
+        self.__tax_sheet_year_2_row: Dict[Tuple[str, int], int] = {}
 
     # pylint: disable=line-too-long
     def _setup_text_data(self, country: AbstractCountry) -> None:
@@ -425,6 +456,14 @@ class Generator(AbstractODSGenerator):
             _("Description"),
         ]
 
+        self.__transaction_type_2_label: Dict[TransactionType, str] = {
+            transaction_type: transaction_type.get_translation().upper() for transaction_type in TransactionType
+        }
+        # Indexed by is_taxable()
+        self.__taxable_labels: Tuple[str, str] = (_("NO"), _("YES"))
+        # Indexed by is_long_term_capital_gains
+        self.__capital_gains_types: Tuple[str, str] = (_("SHORT"), _("LONG"))
+
     def generate(
         self,
         country: AbstractCountry,
@@ -440,6 +479,8 @@ class Generator(AbstractODSGenerator):
             raise RP2TypeError(f"Parameter 'asset_to_computed_data' has non-Dict value {asset_to_computed_data}")
 
         self._setup_text_data(country)
+        self.__in_out_sheet_transaction_2_row.clear()
+        self.__tax_sheet_year_2_row.clear()
 
         template_path: str = self._get_template_path("rp2_full_report", country, generation_language)
 
@@ -505,8 +546,8 @@ class Generator(AbstractODSGenerator):
         output_file.sheets += transaction_sheet
         output_file.sheets += output_sheet
 
-        transaction_sheet.reset(size=(self.__get_number_of_rows_in_transaction_sheet(computed_data), self.MAX_COLUMNS))
-        output_sheet.reset(size=(self.__get_number_of_rows_in_output_sheet(computed_data), self.MAX_COLUMNS))
+        transaction_sheet.reset(size=(self.__get_number_of_rows_in_transaction_sheet(computed_data), self.TRANSACTION_SHEET_COLUMNS))
+        output_sheet.reset(size=(self.__get_number_of_rows_in_output_sheet(computed_data), self.OUTPUT_SHEET_COLUMNS))
 
         new_lines: int = len(computed_data.yearly_gain_loss_list)
         if new_lines:
@@ -527,18 +568,12 @@ class Generator(AbstractODSGenerator):
 
     @staticmethod
     def __get_transaction_visual_style(transaction: AbstractTransaction, year: int) -> _TransactionVisualStyle:
-        visual_style: str = "transparent"
-        highlighted_style: str = "transparent"
-        if transaction.is_taxable():
-            visual_style = "taxable_event"
-            highlighted_style = "highlighted"
-        if year == 0:
-            year = transaction.timestamp.year
-        if transaction.timestamp.year != year:
-            visual_style = f"{visual_style}_border"
-            highlighted_style = f"{highlighted_style}_border"
-            year = transaction.timestamp.year
-        return _TransactionVisualStyle(year, visual_style, highlighted_style)
+        transaction_year: int = transaction.timestamp.year
+        has_border: bool = year not in (0, transaction_year)
+        visual_style: str
+        highlighted_style: str
+        visual_style, highlighted_style = _TAXABLE_AND_BORDER_2_TRANSACTION_STYLES[(transaction.is_taxable(), has_border)]
+        return _TransactionVisualStyle(transaction_year, visual_style, highlighted_style)
 
     @staticmethod
     def __get_border_style(current_year: int, year: int) -> _BorderStyle:
@@ -554,18 +589,50 @@ class Generator(AbstractODSGenerator):
         row_index = self._fill_header(_("In-Flow Detail"), self.__in_header_names_row_1, self.__in_header_names_row_2, sheet, row_index, 0)
 
         in_transaction_set: TransactionSet = computed_data.in_transaction_set
-        entry: AbstractEntry
         year: int = 0
         visual_style: str
         previous_transaction: Optional[InTransaction] = None
         border_style: _BorderStyle
         border_suffix: str = ""
-        for entry in in_transaction_set:
-            transaction: InTransaction = cast(InTransaction, entry)
+        fill_row = self._fill_row
+        transaction_type_2_label: Dict[TransactionType, str] = self.__transaction_type_2_label
+        taxable_labels: Tuple[str, str] = self.__taxable_labels
+        transaction_2_row: Dict[int, int] = self.__in_out_sheet_transaction_2_row
+        # Read all the row fields of a transaction with a single call
+        get_fields = attrgetter(
+            "timestamp",
+            "asset",
+            "exchange",
+            "holder",
+            "transaction_type",
+            "spot_price",
+            "crypto_in",
+            "fiat_fee",
+            "fiat_in_no_fee",
+            "fiat_in_with_fee",
+            "unique_id",
+            "notes",
+        )
+        transaction: InTransaction
+        for transaction in in_transaction_set:  # type: ignore
+            (
+                timestamp,
+                transaction_asset,
+                exchange,
+                holder,
+                transaction_type,
+                spot_price,
+                crypto_in,
+                fiat_fee,
+                fiat_in_no_fee,
+                fiat_in_with_fee,
+                unique_id,
+                notes,
+            ) = get_fields(transaction)
             highlighted_style: str
             transaction_visual_style: _TransactionVisualStyle = self.__get_transaction_visual_style(transaction, year)
             year = transaction_visual_style.year
-            border_style = self.__get_border_style(entry.timestamp.year, year)
+            border_style = self.__get_border_style(timestamp.year, year)
             border_suffix = border_style.border_suffix
             visual_style = transaction_visual_style.visual_style
             highlighted_style = transaction_visual_style.highlighted_style
@@ -574,31 +641,35 @@ class Generator(AbstractODSGenerator):
             # Write _ZERO only on the first in_transaction if there are no sold lots
             if in_lot_sold_percentage == _ZERO and previous_transaction is not None:
                 in_lot_sold_percentage = None
-            self._fill_cell(
+            fill_row(
                 sheet,
                 row_index,
                 0,
-                in_lot_sold_percentage if in_lot_sold_percentage is not None else "",
-                data_style="percent",
-                visual_style="acquired_lot" + border_suffix if in_lot_sold_percentage is not None else "transparent",
+                (
+                    (
+                        in_lot_sold_percentage if in_lot_sold_percentage is not None else "",
+                        _BORDER_SUFFIX_2_STYLE_NAMES[border_suffix]["acquired_lot"] if in_lot_sold_percentage is not None else "transparent",
+                        "percent",
+                    ),
+                    (timestamp, visual_style, "default"),
+                    (transaction_asset, visual_style, "default"),
+                    (exchange, visual_style, "default"),
+                    (holder, visual_style, "default"),
+                    (transaction_type_2_label[transaction_type], visual_style, "default"),
+                    (spot_price, visual_style, "fiat"),
+                    (crypto_in, visual_style, "crypto"),
+                    (computed_data.get_crypto_in_running_sum(transaction), visual_style, "crypto"),
+                    (fiat_fee, visual_style, "fiat"),
+                    (fiat_in_no_fee, visual_style, "fiat"),
+                    (fiat_in_with_fee, highlighted_style, "fiat"),
+                    (taxable_labels[transaction.is_taxable()], visual_style, "fiat"),
+                    ("", visual_style, "default"),
+                    (unique_id, "transparent", "default"),
+                    (notes, "transparent", "default"),
+                ),
             )
-            self._fill_cell(sheet, row_index, 1, transaction.timestamp, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 2, transaction.asset, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 3, transaction.exchange, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 4, transaction.holder, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 5, transaction.transaction_type.get_translation().upper(), visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 6, transaction.spot_price, data_style="fiat", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 7, transaction.crypto_in, data_style="crypto", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 8, computed_data.get_crypto_in_running_sum(transaction), data_style="crypto", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 9, transaction.fiat_fee, data_style="fiat", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 10, transaction.fiat_in_no_fee, data_style="fiat", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 11, transaction.fiat_in_with_fee, data_style="fiat", visual_style=highlighted_style)
-            self._fill_cell(sheet, row_index, 12, _("YES") if transaction.is_taxable() else _("NO"), data_style="fiat", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 13, "", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 14, transaction.unique_id, visual_style="transparent")
-            self._fill_cell(sheet, row_index, 15, transaction.notes, visual_style="transparent")
-
-            self.__in_out_sheet_transaction_2_row[transaction] = row_index + 1
+
+            transaction_2_row[id(transaction)] = row_index + 1
 
             previous_transaction = transaction
             row_index += 1
@@ -610,48 +681,46 @@ class Generator(AbstractODSGenerator):
 
         out_transaction_set: TransactionSet = computed_data.out_transaction_set
 
-        entry: AbstractEntry
         year: int = 0
-        for entry in out_transaction_set:
-            transaction: OutTransaction = cast(OutTransaction, entry)
+        fill_row = self._fill_row
+        transaction_type_2_label: Dict[TransactionType, str] = self.__transaction_type_2_label
+        taxable_labels: Tuple[str, str] = self.__taxable_labels
+        transaction_2_row: Dict[int, int] = self.__in_out_sheet_transaction_2_row
+        transaction: OutTransaction
+        for transaction in out_transaction_set:  # type: ignore
             visual_style: str
             highlighted_style: str
             transaction_visual_style: _TransactionVisualStyle = self.__get_transaction_visual_style(transaction, year)
             year = transaction_visual_style.year
             visual_style = transaction_visual_style.visual_style
             highlighted_style = transaction_visual_style.highlighted_style
-            self._fill_cell(sheet, row_index, 0, "", visual_style="transparent")
-            self._fill_cell(sheet, row_index, 1, transaction.timestamp, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 2, transaction.asset, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 3, transaction.exchange, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 4, transaction.holder, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 5, transaction.transaction_type.get_translation().upper(), visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 6, transaction.spot_price, visual_style=visual_style, data_style="fiat")
-            self._fill_cell(sheet, row_index, 7, transaction.crypto_out_no_fee, visual_style=visual_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 8, transaction.crypto_fee, visual_style=visual_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 9, computed_data.get_crypto_out_running_sum(transaction), data_style="crypto", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 10, computed_data.get_crypto_out_fee_running_sum(transaction), data_style="crypto", visual_style=visual_style)
-            self._fill_cell(
+            fiat_out_no_fee: RP2Decimal = transaction.fiat_out_no_fee
+            fiat_fee: RP2Decimal = transaction.fiat_fee
+            fill_row(
                 sheet,
                 row_index,
-                11,
-                transaction.fiat_out_no_fee,
-                visual_style=highlighted_style if transaction.fiat_out_no_fee > ZERO else visual_style,
-                data_style="fiat",
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                12,
-                transaction.fiat_fee,
-                visual_style=highlighted_style if transaction.fiat_fee > ZERO else visual_style,
-                data_style="fiat",
+                0,
+                (
+                    ("", "transparent", "default"),
+                    (transaction.timestamp, visual_style, "default"),
+                    (transaction.asset, visual_style, "default"),
+                    (transaction.exchange, visual_style, "default"),
+                    (transaction.holder, visual_style, "default"),
+                    (transaction_type_2_label[transaction.transaction_type], visual_style, "default"),
+                    (transaction.spot_price, visual_style, "fiat"),
+                    (transaction.crypto_out_no_fee, visual_style, "crypto"),
+                    (transaction.crypto_fee, visual_style, "crypto"),
+                    (computed_data.get_crypto_out_running_sum(transaction), visual_style, "crypto"),
+                    (computed_data.get_crypto_out_fee_running_sum(transaction), visual_style, "crypto"),
+                    (fiat_out_no_fee, highlighted_style if fiat_out_no_fee > ZERO else visual_style, "fiat"),
+                    (fiat_fee, highlighted_style if fiat_fee > ZERO else visual_style, "fiat"),
+                    (taxable_labels[transaction.is_taxable()], visual_style, "fiat"),
+                    (transaction.unique_id, "transparent", "default"),
+                    (transaction.notes, "transparent", "default"),
+                ),
             )
-            self._fill_cell(sheet, row_index, 13, _("YES") if transaction.is_taxable() else _("NO"), data_style="fiat", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 14, transaction.unique_id, visual_style="transparent")
-            self._fill_cell(sheet, row_index, 15, transaction.notes, visual_style="transparent")
 
-            self.__in_out_sheet_transaction_2_row[transaction] = row_index + 1
+            transaction_2_row[id(transaction)] = row_index + 1
 
             row_index += 1
 
@@ -662,34 +731,43 @@ class Generator(AbstractODSGenerator):
 
         intra_transaction_set: TransactionSet = computed_data.intra_transaction_set
 
-        entry: AbstractEntry
         year: int = 0
-        for entry in intra_transaction_set:
-            transaction: IntraTransaction = cast(IntraTransaction, entry)
+        fill_row = self._fill_row
+        taxable_labels: Tuple[str, str] = self.__taxable_labels
+        transaction_2_row: Dict[int, int] = self.__in_out_sheet_transaction_2_row
+        transaction: IntraTransaction
+        for transaction in intra_transaction_set:  # type: ignore
             visual_style: str
             highlighted_style: str
             transaction_visual_style: _TransactionVisualStyle = self.__get_transaction_visual_style(transaction, year)
             year = transaction_visual_style.year
             visual_style = transaction_visual_style.visual_style
             highlighted_style = transaction_visual_style.highlighted_style
-            self._fill_cell(sheet, row_index, 0, "", visual_style="transparent")
-            self._fill_cell(sheet, row_index, 1, transaction.timestamp, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 2, transaction.asset, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 3, transaction.from_exchange, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 4, transaction.from_holder, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 5, transaction.to_exchange, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 6, transaction.to_holder, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 7, transaction.spot_price, visual_style=visual_style, data_style="fiat")
-            self._fill_cell(sheet, row_index, 8, transaction.crypto_sent, visual_style=visual_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 9, transaction.crypto_received, visual_style=visual_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 10, transaction.crypto_fee, visual_style=visual_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 11, computed_data.get_crypto_intra_fee_running_sum(transaction), data_style="crypto", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 12, transaction.fiat_fee, visual_style=highlighted_style, data_style="fiat")
-            self._fill_cell(sheet, row_index, 13, _("YES") if transaction.is_taxable() else _("NO"), data_style="fiat", visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 14, transaction.unique_id, visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 15, transaction.notes, visual_style="transparent")
-
-            self.__in_out_sheet_transaction_2_row[transaction] = row_index + 1
+            fill_row(
+                sheet,
+                row_index,
+                0,
+                (
+                    ("", "transparent", "default"),
+                    (transaction.timestamp, visual_style, "default"),
+                    (transaction.asset, visual_style, "default"),
+                    (transaction.from_exchange, visual_style, "default"),
+                    (transaction.from_holder, visual_style, "default"),
+                    (transaction.to_exchange, visual_style, "default"),
+                    (transaction.to_holder, visual_style, "default"),
+                    (transaction.spot_price, visual_style, "fiat"),
+                    (transaction.crypto_sent, visual_style, "crypto"),
+                    (transaction.crypto_received, visual_style, "crypto"),
+                    (transaction.crypto_fee, visual_style, "crypto"),
+                    (computed_data.get_crypto_intra_fee_running_sum(transaction), visual_style, "crypto"),
+                    (transaction.fiat_fee, highlighted_style, "fiat"),
+                    (taxable_labels[transaction.is_taxable()], visual_style, "fiat"),
+                    (transaction.unique_id, visual_style, "default"),
+                    (transaction.notes, "transparent", "default"),
+                ),
+            )
+
+            transaction_2_row[id(transaction)] = row_index + 1
 
             row_index += 1
 
@@ -701,35 +779,29 @@ class Generator(AbstractODSGenerator):
         )
 
         year: int = 0
+        fill_row = self._fill_row
+        capital_gains_types: Tuple[str, str] = self.__capital_gains_types
         for yearly_gain_loss in yearly_gain_loss_list:
-            border_suffix: str = ""
-            capital_gains_type: str = _("LONG") if yearly_gain_loss.is_long_term_capital_gains else _("SHORT")
+            capital_gains_type: str = capital_gains_types[yearly_gain_loss.is_long_term_capital_gains]
             border_style: _BorderStyle = self.__get_border_style(yearly_gain_loss.year, year)
             year = border_style.year
-            border_suffix = border_style.border_suffix
-            self._fill_cell(sheet, row_index, 0, yearly_gain_loss.year, visual_style="transparent" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 1, yearly_gain_loss.asset, visual_style="transparent" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 2, yearly_gain_loss.fiat_gain_loss, visual_style="bold" + border_suffix, data_style="fiat")
-            self._fill_cell(sheet, row_index, 3, capital_gains_type, visual_style="bold" + border_suffix, data_style="default")
-            self._fill_cell(
-                sheet, row_index, 4, yearly_gain_loss.transaction_type.get_translation().upper(), visual_style="bold" + border_suffix, data_style="default"
-            )
-            self._fill_cell(sheet, row_index, 5, yearly_gain_loss.crypto_amount, visual_style="transparent" + border_suffix, data_style="crypto")
-            self._fill_cell(
+            style_names: Dict[str, str] = _BORDER_SUFFIX_2_STYLE_NAMES[border_style.border_suffix]
+            transparent_style: str = style_names["transparent"]
+            bold_style: str = style_names["bold"]
+            fill_row(
                 sheet,
                 row_index,
-                6,
-                yearly_gain_loss.fiat_amount,
-                visual_style="taxable_event" + border_suffix,
-                data_style="fiat",
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                7,
-                yearly_gain_loss.fiat_cost_basis,
-                visual_style="acquired_lot" + border_suffix,
-                data_style="fiat",
+                0,
+                (
+                    (yearly_gain_loss.year, transparent_style, "default"),
+                    (yearly_gain_loss.asset, transparent_style, "default"),
+                    (yearly_gain_loss.fiat_gain_loss, bold_style, "fiat"),
+                    (capital_gains_type, bold_style, "default"),
+                    (self.__transaction_type_2_label[yearly_gain_loss.transaction_type], bold_style, "default"),
+                    (yearly_gain_loss.crypto_amount, transparent_style, "crypto"),
+                    (yearly_gain_loss.fiat_amount, style_names["taxable_event"], "fiat"),
+                    (yearly_gain_loss.fiat_cost_basis, style_names["acquired_lot"], "fiat"),
+                ),
             )
             row_index += 1
 
@@ -740,33 +812,35 @@ class Generator(AbstractODSGenerator):
 
         totals: Dict[str, RP2Decimal] = {}
         value: RP2Decimal
+        fill_row = self._fill_row
         for balance in balance_set:
-            self._fill_cell(sheet, row_index, 0, balance.exchange, visual_style="bold", data_style="default")
-            self._fill_cell(sheet, row_index, 1, balance.holder, visual_style="bold", data_style="default")
-            self._fill_cell(sheet, row_index, 2, balance.asset)
-            self._fill_cell(sheet, row_index, 3, balance.acquired_balance, data_style="crypto")
-            self._fill_cell(sheet, row_index, 4, balance.sent_balance, data_style="crypto")
-            self._fill_cell(sheet, row_index, 5, balance.received_balance, data_style="crypto")
-            self._fill_cell(sheet, row_index, 6, balance.final_balance, visual_style="bold", data_style="crypto")
-            value = totals.setdefault(balance.holder, _ZERO)
-            value += balance.final_balance
-            totals[balance.holder] = value
+            fill_row(
+                sheet,
+                row_index,
+                0,
+                (
+                    (balance.exchange, "bold", "default"),
+                    (balance.holder, "bold", "default"),
+                    (balance.asset, "transparent", "default"),
+                    (balance.acquired_balance, "transparent", "crypto"),
+                    (balance.sent_balance, "transparent", "crypto"),
+                    (balance.received_balance, "transparent", "crypto"),
+                    (balance.final_balance, "bold", "crypto"),
+                ),
+            )
+            totals[balance.holder] = totals.get(balance.holder, _ZERO) + balance.final_balance
             row_index += 1
 
         holder: str
-        border_drawn: bool = False
+        # Only the first total row has a border
+        border_suffix: str = "_border"
         for holder, value in sorted(totals.items()):
-            border_suffix: str = ""
-            if not border_drawn:
-                border_suffix = "_border"
-                border_drawn = True
-            self._fill_cell(sheet, row_index, 0, _("Total"), visual_style="bold" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 1, holder, visual_style="bold" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 2, "", visual_style="transparent" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 3, "", visual_style="transparent" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 4, "", visual_style="transparent" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 5, "", visual_style="transparent" + border_suffix, data_style="default")
-            self._fill_cell(sheet, row_index, 6, value, visual_style="bold" + border_suffix, data_style="crypto")
+            style_names: Dict[str, str] = _BORDER_SUFFIX_2_STYLE_NAMES[border_suffix]
+            border_suffix = ""
+            self._fill_cell(sheet, row_index, 0, _("Total"), visual_style=style_names["bold"], data_style="default")
+            self._fill_cell(sheet, row_index, 1, holder, visual_style=style_names["bold"], data_style="default")
+            self._fill_blank_cells(sheet, row_index, 2, 4, style_names["transparent"])
+            self._fill_cell(sheet, row_index, 6, value, visual_style=style_names["bold"], data_style="crypto")
             row_index += 1
 
         return row_index
@@ -779,25 +853,27 @@ class Generator(AbstractODSGenerator):
 
         return row_index + 4
 
-    def __get_hyperlinked_transaction_value(self, transaction: AbstractTransaction, value: Any) -> Any:
+    def __get_transaction_hyperlink_target(self, in_out_sheet_name: str, transaction: AbstractTransaction) -> Optional[str]:
         row: Optional[int] = self.__get_in_out_sheet_row(transaction)
         if not row:
             # This may occur if command line time filters are activated
-            return value
-        if isinstance(value, (RP2Decimal, int, float)):
-            return f'=HYPERLINK("#{self.get_in_out_sheet_name(transaction.asset)}.a{row}:z{row}"; {value})'
-        return f'=HYPERLINK("#{self.get_in_out_sheet_name(transaction.asset)}.a{row}:z{row}"; "{value}")'
+            return None
+        return f"#{in_out_sheet_name}.a{row}:z{row}"
+
+    def __get_summary_hyperlink_target(self, tax_sheet_name: str, asset: str, year: int) -> str:
+        row: int = self.__tax_sheet_year_2_row[(asset, year)]
+        return f"#{tax_sheet_name}.a{row}:z{row}"
 
-    def __get_hyperlinked_summary_value(self, asset: str, value: Any, year: int) -> Any:
-        row: int = self.__tax_sheet_year_2_row[_AssetAndYear(asset, year)]
+    @staticmethod
+    def __get_hyperlinked_value(target: Optional[str], value: Any) -> Any:
+        if target is None:
+            return value
         if isinstance(value, (RP2Decimal, int, float)):
-            return f'=HYPERLINK("#{self.get_tax_sheet_name(asset)}.a{row}:z{row}"; {value})'
-        return f'=HYPERLINK("#{self.get_tax_sheet_name(asset)}.a{row}:z{row}"; "{value}")'
+            return f'=HYPERLINK("{target}"; {value})'
+        return f'=HYPERLINK("{target}"; "{value}")'
 
     def __get_in_out_sheet_row(self, transaction: AbstractTransaction) -> Optional[int]:
-        if transaction not in self.__in_out_sheet_transaction_2_row:
-            return None
-        return self.__in_out_sheet_transaction_2_row[transaction]
+        return self.__in_out_sheet_transaction_2_row.get(id(transaction))
 
     def __generate_gain_loss_detail(self, sheet: Any, asset: str, computed_data: ComputedData, row_index: int) -> int:
         row_index = self._fill_header(
@@ -805,225 +881,184 @@ class Generator(AbstractODSGenerator):
         )
 
         gain_loss_set: GainLossSet = computed_data.gain_loss_set
+        if gain_loss_set.is_empty():
+            return row_index
 
-        taxable_event_style_modifier: str = ""
-        acquired_lot_style_modifier: str = "_alt"
+        taxable_event_style_name: str = "taxable_event"
+        acquired_lot_style_name: str = "acquired_lot_alt"
         year: int = 0
         border_style: _BorderStyle
 
+        # Style names that only depend on the border suffix are rebuilt only when the suffix changes (at year boundaries)
+        previous_border_suffix: Optional[str] = None
+        style_names: Dict[str, str] = _BORDER_SUFFIX_2_STYLE_NAMES[""]
+        transparent_style: str = ""
+        highlighted_style: str = ""
+        taxable_event_note_style: str = ""
+        acquired_lot_note_style: str = ""
+
+        capital_gains_types: Tuple[str, str] = self.__capital_gains_types
+
+        # Bind methods used on every row to locals
+        fill_row = self._fill_row
+        get_transaction_hyperlink_target = self.__get_transaction_hyperlink_target
+        get_hyperlinked_value = self.__get_hyperlinked_value
+        in_out_sheet_name: str = self.get_in_out_sheet_name(asset)
+
+        # The number of fractions only changes with the transaction: look it up once per run of fractions
+        previous_taxable_event: Optional[AbstractTransaction] = None
+        total_taxable_event_fractions: int = 0
         previous_acquired_lot: Optional[InTransaction] = None
-        for entry in gain_loss_set:
-            gain_loss: GainLoss = cast(GainLoss, entry)
+        total_acquired_lot_fractions: int = 0
+        gain_loss: GainLoss
+        for gain_loss in gain_loss_set:  # type: ignore
+            taxable_event: AbstractTransaction = gain_loss.taxable_event
+            acquired_lot: Optional[InTransaction] = gain_loss.acquired_lot
+            crypto_amount: RP2Decimal = gain_loss.crypto_amount
+            # Every hyperlinked cell of a transaction points to the same in/out sheet row: compute the target once per row
+            taxable_event_target: Optional[str] = get_transaction_hyperlink_target(in_out_sheet_name, taxable_event)
             border_suffix: str = ""
-            border_style = self.__get_border_style(gain_loss.taxable_event.timestamp.year, year)
-            if gain_loss.taxable_event.timestamp.year != year:
-                self.__tax_sheet_year_2_row[_AssetAndYear(asset, gain_loss.taxable_event.timestamp.year)] = row_index + 1
+            border_style = self.__get_border_style(taxable_event.timestamp.year, year)
+            if taxable_event.timestamp.year != year:
+                self.__tax_sheet_year_2_row[(asset, taxable_event.timestamp.year)] = row_index + 1
             year = border_style.year
             border_suffix = border_style.border_suffix
-            transparent_style: str = f"transparent{border_suffix}"
-            taxable_event_style: str = f"taxable_event{taxable_event_style_modifier}{border_suffix}"
-            highlighted_style: str = f"highlighted{border_suffix}"
+            if border_suffix != previous_border_suffix:
+                style_names = _BORDER_SUFFIX_2_STYLE_NAMES[border_suffix]
+                transparent_style = style_names["transparent"]
+                highlighted_style = style_names["highlighted"]
+                taxable_event_note_style = style_names["taxable_event_note"]
+                acquired_lot_note_style = style_names["acquired_lot_note"]
+                previous_border_suffix = border_suffix
+            taxable_event_style: str = style_names[taxable_event_style_name]
             current_taxable_event_fraction: int = gain_loss_set.get_taxable_event_fraction(gain_loss) + 1
-            total_taxable_event_fractions: int = gain_loss_set.get_taxable_event_number_of_fractions(gain_loss.taxable_event)
+            if taxable_event is not previous_taxable_event:
+                total_taxable_event_fractions = gain_loss_set.get_taxable_event_number_of_fractions(taxable_event)
+                previous_taxable_event = taxable_event
             transaction_type: str = (
-                f"{self._get_table_type_from_transaction(gain_loss.taxable_event)} / " f"{gain_loss.taxable_event.transaction_type.get_translation().upper()}"
+                f"{self._get_table_type_from_transaction(taxable_event)} / {self.__transaction_type_2_label[taxable_event.transaction_type]}"
             )
             taxable_event_note: str = (
                 f"{current_taxable_event_fraction}/"
                 f"{total_taxable_event_fractions}: "
-                f"{gain_loss.crypto_amount:.8f} of "
-                f"{gain_loss.taxable_event.crypto_balance_change:.8f} "
+                f"{crypto_amount:.8f} of "
+                f"{taxable_event.crypto_balance_change:.8f} "
                 f"{asset}"
             )
             acquired_lot_style: str
 
-            self._fill_cell(sheet, row_index, 0, gain_loss.crypto_amount, visual_style=transparent_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 1, gain_loss.asset, visual_style=transparent_style)
-            self._fill_cell(sheet, row_index, 2, computed_data.get_crypto_gain_loss_running_sum(gain_loss), visual_style=transparent_style, data_style="crypto")
-            self._fill_cell(sheet, row_index, 3, gain_loss.fiat_gain, visual_style=transparent_style, data_style="fiat")
-            self._fill_cell(sheet, row_index, 4, _("LONG") if gain_loss.is_long_term_capital_gains() else _("SHORT"), visual_style=transparent_style)
-            self._fill_cell(
-                sheet,
-                row_index,
-                5,
-                self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, gain_loss.taxable_event.timestamp),
-                visual_style=taxable_event_style,
-            )
-            self._fill_cell(
-                sheet, row_index, 6, self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, transaction_type), visual_style=taxable_event_style
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                7,
-                self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, gain_loss.taxable_event_fraction_percentage),
-                visual_style=taxable_event_style,
-                data_style="percent",
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                8,
-                self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, gain_loss.taxable_event_fiat_amount_with_fee_fraction),
-                visual_style=highlighted_style,
-                data_style="fiat",
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                9,
-                self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, gain_loss.taxable_event.spot_price),
-                visual_style=taxable_event_style,
-                data_style="fiat",
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                10,
-                self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, gain_loss.taxable_event.unique_id),
-                visual_style=taxable_event_style,
-                data_style="fiat",
-            )
-            self._fill_cell(
+            fill_row(
                 sheet,
                 row_index,
-                11,
-                self.__get_hyperlinked_transaction_value(gain_loss.taxable_event, taxable_event_note),
-                visual_style=f"taxable_event_note{border_suffix}",
+                0,
+                (
+                    (crypto_amount, transparent_style, "crypto"),
+                    (gain_loss.asset, transparent_style, "default"),
+                    (computed_data.get_crypto_gain_loss_running_sum(gain_loss), transparent_style, "crypto"),
+                    (gain_loss.fiat_gain, transparent_style, "fiat"),
+                    (capital_gains_types[gain_loss.is_long_term_capital_gains()], transparent_style, "default"),
+                    (get_hyperlinked_value(taxable_event_target, taxable_event.timestamp), taxable_event_style, "default"),
+                    (get_hyperlinked_value(taxable_event_target, transaction_type), taxable_event_style, "default"),
+                    (
+                        get_hyperlinked_value(taxable_event_target, gain_loss.taxable_event_fraction_percentage),
+                        taxable_event_style,
+                        "percent",
+                    ),
+                    (
+                        get_hyperlinked_value(taxable_event_target, gain_loss.taxable_event_fiat_amount_with_fee_fraction),
+                        highlighted_style,
+                        "fiat",
+                    ),
+                    (get_hyperlinked_value(taxable_event_target, taxable_event.spot_price), taxable_event_style, "fiat"),
+                    (get_hyperlinked_value(taxable_event_target, taxable_event.unique_id), taxable_event_style, "fiat"),
+                    (get_hyperlinked_value(taxable_event_target, taxable_event_note), taxable_event_note_style, "default"),
+                ),
             )
             if current_taxable_event_fraction == total_taxable_event_fractions:
                 # Last fraction: change color
-                taxable_event_style_modifier = "" if taxable_event_style_modifier == "_alt" else "_alt"
+                taxable_event_style_name = "taxable_event" if taxable_event_style_name == "taxable_event_alt" else "taxable_event_alt"
 
-            if gain_loss.acquired_lot:
-                if gain_loss.acquired_lot != previous_acquired_lot:
+            if acquired_lot:
+                # Acquired lots in a pass are the same objects: identity is enough to detect a new lot run
+                if acquired_lot is not previous_acquired_lot:
                     # Last fraction: change color
-                    acquired_lot_style_modifier = "" if acquired_lot_style_modifier == "_alt" else "_alt"
-                acquired_lot_style = f"acquired_lot{acquired_lot_style_modifier}{border_suffix}"
+                    acquired_lot_style_name = "acquired_lot" if acquired_lot_style_name == "acquired_lot_alt" else "acquired_lot_alt"
+                    total_acquired_lot_fractions = gain_loss_set.get_acquired_lot_number_of_fractions(acquired_lot)
+                acquired_lot_style = style_names[acquired_lot_style_name]
+                acquired_lot_target: Optional[str] = get_transaction_hyperlink_target(in_out_sheet_name, acquired_lot)
                 current_acquired_lot_fraction: int = gain_loss_set.get_acquired_lot_fraction(gain_loss) + 1
-                total_acquired_lot_fractions: int = gain_loss_set.get_acquired_lot_number_of_fractions(gain_loss.acquired_lot)
                 acquired_lot_note: str = (
                     f"{current_acquired_lot_fraction}/"
                     f"{total_acquired_lot_fractions}: "
-                    f"{gain_loss.crypto_amount:.8f} of "
-                    f"{gain_loss.acquired_lot.crypto_balance_change:.8f} "
+                    f"{crypto_amount:.8f} of "
+                    f"{acquired_lot.crypto_balance_change:.8f} "
                     f"{asset}"
                 )
-                self._fill_cell(
+                fill_row(
                     sheet,
                     row_index,
                     12,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, gain_loss.acquired_lot.timestamp),
-                    visual_style=acquired_lot_style,
-                )
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    13,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, gain_loss.acquired_lot_fraction_percentage),
-                    visual_style=acquired_lot_style,
-                    data_style="percent",
-                )
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    14,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, gain_loss.acquired_lot_fiat_amount_with_fee_fraction),
-                    visual_style=acquired_lot_style,
-                    data_style="fiat",
-                )
-                fiat_fee_fraction: RP2Decimal = gain_loss.acquired_lot.fiat_fee * gain_loss.acquired_lot_fraction_percentage
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    15,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, fiat_fee_fraction),
-                    visual_style=acquired_lot_style,
-                    data_style="fiat",
-                )
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    16,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, gain_loss.fiat_cost_basis),
-                    visual_style=highlighted_style,
-                    data_style="fiat",
-                )
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    17,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, gain_loss.acquired_lot.spot_price),
-                    visual_style=acquired_lot_style,
-                    data_style="fiat",
-                )
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    18,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, gain_loss.acquired_lot.unique_id),
-                    visual_style=acquired_lot_style,
-                    data_style="fiat",
-                )
-                self._fill_cell(
-                    sheet,
-                    row_index,
-                    19,
-                    self.__get_hyperlinked_transaction_value(gain_loss.acquired_lot, acquired_lot_note),
-                    visual_style=f"acquired_lot_note{border_suffix}",
+                    (
+                        (get_hyperlinked_value(acquired_lot_target, acquired_lot.timestamp), acquired_lot_style, "default"),
+                        (
+                            get_hyperlinked_value(acquired_lot_target, gain_loss.acquired_lot_fraction_percentage),
+                            acquired_lot_style,
+                            "percent",
+                        ),
+                        (
+                            get_hyperlinked_value(acquired_lot_target, gain_loss.acquired_lot_fiat_amount_with_fee_fraction),
+                            acquired_lot_style,
+                            "fiat",
+                        ),
+                        (get_hyperlinked_value(acquired_lot_target, gain_loss.acquired_lot_fiat_fee_fraction), acquired_lot_style, "fiat"),
+                        (get_hyperlinked_value(acquired_lot_target, gain_loss.fiat_cost_basis), highlighted_style, "fiat"),
+                        (get_hyperlinked_value(acquired_lot_target, acquired_lot.spot_price), acquired_lot_style, "fiat"),
+                        (get_hyperlinked_value(acquired_lot_target, acquired_lot.unique_id), acquired_lot_style, "fiat"),
+                        (get_hyperlinked_value(acquired_lot_target, acquired_lot_note), acquired_lot_note_style, "default"),
+                    ),
                 )
 
-                previous_acquired_lot = gain_loss.acquired_lot
+                previous_acquired_lot = acquired_lot
             else:
-                acquired_lot_style = f"acquired_lot{acquired_lot_style_modifier}{border_suffix}"
-                for i in range(12, 19):
-                    self._fill_cell(sheet, row_index, i, "", visual_style=f"{acquired_lot_style}")
+                acquired_lot_style = style_names[acquired_lot_style_name]
+                self._fill_blank_cells(sheet, row_index, 12, 7, acquired_lot_style)
 
             row_index += 1
 
         return row_index
 
     def __generate_yearly_gain_loss_summary(self, sheet: Any, asset: str, yearly_gain_loss_list: List[YearlyGainLoss], row_index: int) -> int:
+        if not yearly_gain_loss_list:
+            return row_index
+
+        style_names: Tuple[str, ...] = tuple(
+            f"transparent_{data_style}" for data_style in ("default", "default", "fiat", "default", "default", "crypto", "fiat", "fiat")
+        )
+        capital_gains_types: Tuple[str, str] = self.__capital_gains_types
+        transaction_type_2_label: Dict[TransactionType, str] = self.__transaction_type_2_label
+        fill_row = self._fill_styled_row
+        get_hyperlinked_value = self.__get_hyperlinked_value
+        tax_sheet_name: str = self.get_tax_sheet_name(asset)
         for gain_loss in yearly_gain_loss_list:
-            visual_style: str = "transparent"
-            capital_gains_type: str = _("LONG") if gain_loss.is_long_term_capital_gains else _("SHORT")
+            capital_gains_type: str = capital_gains_types[gain_loss.is_long_term_capital_gains]
             year: int = gain_loss.year
-            self._fill_cell(sheet, row_index, 0, self.__get_hyperlinked_summary_value(asset, year, year), visual_style=visual_style)
-            self._fill_cell(sheet, row_index, 1, self.__get_hyperlinked_summary_value(asset, asset, year), visual_style=visual_style)
-            self._fill_cell(
+            # All cells in the row link to the same place: compute the target once per row
+            target: str = self.__get_summary_hyperlink_target(tax_sheet_name, asset, year)
+            fill_row(
                 sheet,
                 row_index,
-                2,
-                self.__get_hyperlinked_summary_value(asset, gain_loss.fiat_gain_loss, year),
-                visual_style=visual_style,
-                data_style="fiat",
-            )
-            self._fill_cell(sheet, row_index, 3, self.__get_hyperlinked_summary_value(asset, capital_gains_type, year), visual_style=visual_style)
-            self._fill_cell(
-                sheet,
-                row_index,
-                4,
-                self.__get_hyperlinked_summary_value(asset, gain_loss.transaction_type.get_translation().upper(), year),
-                visual_style=visual_style,
-            )
-            self._fill_cell(
-                sheet, row_index, 5, self.__get_hyperlinked_summary_value(asset, gain_loss.crypto_amount, year), visual_style=visual_style, data_style="crypto"
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                6,
-                self.__get_hyperlinked_summary_value(asset, gain_loss.fiat_amount, year),
-                visual_style=visual_style,
-                data_style="fiat",
-            )
-            self._fill_cell(
-                sheet,
-                row_index,
-                7,
-                self.__get_hyperlinked_summary_value(asset, gain_loss.fiat_cost_basis, year),
-                visual_style=visual_style,
-                data_style="fiat",
+                0,
+                (
+                    get_hyperlinked_value(target, year),
+                    get_hyperlinked_value(target, asset),
+                    get_hyperlinked_value(target, gain_loss.fiat_gain_loss),
+                    get_hyperlinked_value(target, capital_gains_type),
+                    get_hyperlinked_value(target, transaction_type_2_label[gain_loss.transaction_type]),
+                    get_hyperlinked_value(target, gain_loss.crypto_amount),
+                    get_hyperlinked_value(target, gain_loss.fiat_amount),
+                    get_hyperlinked_value(target, gain_loss.fiat_cost_basis),
+                ),
+                style_names,
             )
             row_index += 1
 
@@ -16,7 +16,7 @@ import logging
 from datetime import date
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple, cast
+from typing import Any, Dict, List, Set, Tuple
 
 from rp2.abstract_country import AbstractCountry
 from rp2.computed_data import ComputedData
@@ -47,6 +47,13 @@ class SheetNames(Enum):
 
 _TEMPLATE_SHEETS_TO_KEEP: Set[str] = {f"__{item.value}" for item in SheetNames}
 
+# Indexed by is_long_term_capital_gains()
+_LONG_SHORT: Tuple[str, str] = ("SHORT", "LONG")
+
+# Transparent, taxable event note and acquired lot note visual styles: the first row has a border, the others don't
+_FIRST_ROW_VISUAL_STYLES: Tuple[str, str, str] = ("transparent_border", "taxable_event_note_border", "acquired_lot_note_border")
+_VISUAL_STYLES: Tuple[str, str, str] = ("transparent", "taxable_event_note", "acquired_lot_note")
+
 _SHEET_TO_TYPES: Dict[str, Tuple[TransactionType, ...]] = {
     SheetNames.AIRDROPS.value: (TransactionType.AIRDROP,),
     SheetNames.CAPITAL_GAINS.value: (TransactionType.SELL,),
@@ -142,9 +149,12 @@ class Generator(AbstractODSGenerator):
             for sheet_type in sheet_types:
                 sheet.append_rows(self.MIN_ROWS + gain_loss_set.get_transaction_type_count(sheet_type) + 1)
 
-        border_suffix: str = "_border"
-        for entry in gain_loss_set:
-            gain_loss: GainLoss = cast(GainLoss, entry)
+        transparent_vs: str
+        taxable_event_note_vs: str
+        acquired_lot_note_vs: str
+        transparent_vs, taxable_event_note_vs, acquired_lot_note_vs = _FIRST_ROW_VISUAL_STYLES
+        gain_loss: GainLoss
+        for gain_loss in gain_loss_set:  # type: ignore
             sheet_type = gain_loss.taxable_event.transaction_type
             sheet = output_file.sheets[_TYPE_TO_SHEET[sheet_type]]
             row_index: int = row_indexes[sheet.name]
@@ -160,23 +170,8 @@ class Generator(AbstractODSGenerator):
                 f"{gain_loss.taxable_event.crypto_balance_change:.8f} "
                 f"{asset}"
             )
-            transparent_vs: str = f"transparent{border_suffix}"
-            taxable_event_note_vs: str = f"taxable_event_note{border_suffix}"
-            acquired_lot_note_vs: str = f"acquired_lot_note{border_suffix}"
-
-            self._fill_cell(sheet, row_index, 0, gain_loss.crypto_amount, visual_style=transparent_vs, data_style="crypto")
-            self._fill_cell(sheet, row_index, 1, gain_loss.asset, visual_style=transparent_vs)
-            self._fill_cell(sheet, row_index, 3, gain_loss.taxable_event.timestamp.strftime("%m/%d/%Y"), visual_style=taxable_event_note_vs)
-            self._fill_cell(sheet, row_index, 4, gain_loss.taxable_event_fiat_amount_with_fee_fraction, visual_style=taxable_event_note_vs, data_style="fiat")
-            self._fill_cell(sheet, row_index, 6, "", visual_style=transparent_vs)
-            self._fill_cell(sheet, row_index, 7, "", visual_style=transparent_vs)
-            self._fill_cell(sheet, row_index, 8, gain_loss.fiat_gain, visual_style=transparent_vs, data_style="fiat")
-            self._fill_cell(sheet, row_index, 9, transaction_type, visual_style=taxable_event_note_vs)
-            self._fill_cell(sheet, row_index, 12, taxable_event_note, visual_style=taxable_event_note_vs)
-            self._fill_cell(sheet, row_index, 13, gain_loss.taxable_event.unique_id, visual_style=taxable_event_note_vs)
-            self._fill_cell(sheet, row_index, 14, "LONG" if gain_loss.is_long_term_capital_gains() else "SHORT", visual_style=taxable_event_note_vs)
-            self._fill_cell(sheet, row_index, 15, gain_loss.taxable_event.timestamp, visual_style=taxable_event_note_vs)
-
+            # Cells 2, 5, 10 and 11 describe the acquired lot (if any)
+            acquired_lot_cells: Tuple[Tuple[Any, str, str], ...]
             if gain_loss.acquired_lot:
                 current_acquired_lot_fraction: int = gain_loss_set.get_acquired_lot_fraction(gain_loss) + 1
                 total_acquired_lot_fractions: int = gain_loss_set.get_acquired_lot_number_of_fractions(gain_loss.acquired_lot)
@@ -187,15 +182,38 @@ class Generator(AbstractODSGenerator):
                     f"{gain_loss.acquired_lot.crypto_balance_change:.8f} "
                     f"{asset}"
                 )
-                self._fill_cell(sheet, row_index, 2, gain_loss.acquired_lot.timestamp.strftime("%m/%d/%Y"), visual_style=acquired_lot_note_vs)
-                self._fill_cell(sheet, row_index, 5, gain_loss.fiat_cost_basis, visual_style=acquired_lot_note_vs, data_style="fiat")
-                self._fill_cell(sheet, row_index, 10, acquired_lot_note, visual_style=acquired_lot_note_vs)
-                self._fill_cell(sheet, row_index, 11, gain_loss.acquired_lot.unique_id, visual_style=acquired_lot_note_vs)
+                acquired_lot_cells = (
+                    (gain_loss.acquired_lot.timestamp.strftime("%m/%d/%Y"), acquired_lot_note_vs, "default"),
+                    (gain_loss.fiat_cost_basis, acquired_lot_note_vs, "fiat"),
+                    (acquired_lot_note, acquired_lot_note_vs, "default"),
+                    (gain_loss.acquired_lot.unique_id, acquired_lot_note_vs, "default"),
+                )
             else:
-                self._fill_cell(sheet, row_index, 2, "", visual_style=transparent_vs)
-                self._fill_cell(sheet, row_index, 5, "", visual_style=transparent_vs)
-                self._fill_cell(sheet, row_index, 10, "", visual_style=transparent_vs)
-                self._fill_cell(sheet, row_index, 11, "", visual_style=transparent_vs)
+                acquired_lot_cells = (("", transparent_vs, "default"),) * 4
+
+            self._fill_row(
+                sheet,
+                row_index,
+                0,
+                (
+                    (gain_loss.crypto_amount, transparent_vs, "crypto"),
+                    (gain_loss.asset, transparent_vs, "default"),
+                    acquired_lot_cells[0],
+                    (gain_loss.taxable_event.timestamp.strftime("%m/%d/%Y"), taxable_event_note_vs, "default"),
+                    (gain_loss.taxable_event_fiat_amount_with_fee_fraction, taxable_event_note_vs, "fiat"),
+                    acquired_lot_cells[1],
+                    ("", transparent_vs, "default"),
+                    ("", transparent_vs, "default"),
+                    (gain_loss.fiat_gain, transparent_vs, "fiat"),
+                    (transaction_type, taxable_event_note_vs, "default"),
+                    acquired_lot_cells[2],
+                    acquired_lot_cells[3],
+                    (taxable_event_note, taxable_event_note_vs, "default"),
+                    (gain_loss.taxable_event.unique_id, taxable_event_note_vs, "default"),
+                    (_LONG_SHORT[gain_loss.is_long_term_capital_gains()], taxable_event_note_vs, "default"),
+                    (gain_loss.taxable_event.timestamp, taxable_event_note_vs, "default"),
+                ),
+            )
 
-            border_suffix = ""
+            transparent_vs, taxable_event_note_vs, acquired_lot_note_vs = _VISUAL_STYLES
             row_indexes[sheet.name] = row_index + 1
@@ -20,7 +20,7 @@ from rp2.in_transaction import InTransaction
 from rp2.intra_transaction import IntraTransaction
 from rp2.out_transaction import OutTransaction
 from rp2.plugin.country.us import US
-from rp2.rp2_decimal import RP2Decimal
+from rp2.rp2_decimal import ZERO, RP2Decimal
 from rp2.rp2_error import RP2TypeError, RP2ValueError
 
 
@@ -119,6 +119,7 @@ class TestGainLoss(unittest.TestCase):
         self.assertEqual(flow.timestamp, flow.taxable_event.timestamp)
         self.assertEqual(flow.crypto_balance_change, RP2Decimal("0.1"))
         self.assertEqual(flow.taxable_event_fiat_amount_with_fee_fraction, RP2Decimal("1100"))
+        self.assertEqual(flow.acquired_lot_fiat_fee_fraction, ZERO)
         self.assertEqual(
             str(flow),
             """GainLoss:
@@ -163,6 +164,7 @@ class TestGainLoss(unittest.TestCase):
         self.assertEqual(flow.timestamp, flow.taxable_event.timestamp)
         self.assertEqual(flow.crypto_balance_change, RP2Decimal("0.001"))
         self.assertEqual(flow.taxable_event_fiat_amount_with_fee_fraction, RP2Decimal("12.5"))
+        self.assertEqual(flow.acquired_lot_fiat_fee_fraction, RP2Decimal("0.0099990001"))
         self.assertEqual(
             str(flow),
             """GainLoss: